@@ -2,13 +2,18 @@ import wifi
 import socketpool
 import ssl
 import adafruit_requests
+import adafruit_connection_manager
 import time
+import random
 import board
+import alarm
 from adafruit_ht16k33.matrix import Matrix8x8x2
 import os
 import rtc
 import adafruit_ntp
 import gc
+from array import array
+from micropython import const
 import microcontroller
 from microcontroller import watchdog as wdt
 from watchdog import WatchDogMode
@@ -71,9 +76,20 @@ def is_us_dst(t):
 # Serial "display mirror": set DISPLAY_DUMP="0" in settings.toml to silence.
 DISPLAY_DUMP = os.getenv('DISPLAY_DUMP', '1') == '1'
 
+# ASCII tide chart on the serial console: set DEBUG_ASCII="1" in settings.toml
+# to enable. Off by default so 24/7 operation skips its strings and prints.
+DEBUG_ASCII = os.getenv('DEBUG_ASCII', '0') == '1'
+
 # NOAA API endpoint
 API_URL = "https://api.tidesandcurrents.noaa.gov/api/prod/datagetter"
 
+# Built once at import: loading the CA roots is slow on a microcontroller
+SSL_CONTEXT = ssl.create_default_context()
+
+# Chart height bounds for normalize_tide_levels; const() inlines them
+_MAX = const(7)  # Top row
+_MID = const(4)  # Row used when the day's levels are flat
+
 # 3x5 pixel font for digits 0-9 and colon/slash
 # Each character is 3 columns wide, 5 rows tall, stored as column bitmasks (LSB = top row)
 FONT_3X5 = {
@@ -91,11 +107,76 @@ FONT_3X5 = {
     ':': (0x00, 0x0A, 0x00),
 }
 
+# An all-off 16-byte frame, used to reset frame buffers in place
+BLANK_FRAME = bytes(16)
+
+
+def _build_error_frame():
+    """Red X across one matrix (frame layout as in TideMatrix)"""
+    frame = bytearray(16)
+    for i in range(8):
+        frame[2 * i + 1] = (1 << i) | (1 << (7 - i))  # Both diagonals, red plane
+    return bytes(frame)
+
+
+def _build_safe_mode_frame():
+    """Yellow border around one matrix (frame layout as in TideMatrix)"""
+    frame = bytearray(16)
+    for x in range(8):
+        # Edge columns fully lit, inner columns only their top and bottom
+        # rows, on both color planes
+        edge = 0xFF if x in (0, 7) else 0x81
+        frame[2 * x] = edge
+        frame[2 * x + 1] = edge
+    return bytes(frame)
+
+
+# Static screens, built once instead of repainting them on every call
+ERROR_FRAME = _build_error_frame()
+SAFE_MODE_FRAME = _build_safe_mode_frame()
+
+
+class TideMatrix(Matrix8x8x2):
+    """Matrix8x8x2 that can load a whole prebuilt frame in one I2C write.
+
+    A frame is the 16-byte HT16K33 display RAM image: byte 2*x holds the
+    green LEDs of column x and byte 2*x+1 the red LEDs, bit y = row y.
+    Yellow is both bits set.
+    """
+
+    def load(self, frame):
+        """Replace the display buffer with a 16-byte frame (call show() to display)"""
+        self._buffer[1:17] = frame  # Byte 0 is the display RAM register address
+
+    def blit(self, frame):
+        """Replace the display buffer with a 16-byte frame and show it"""
+        self.load(frame)
+        self.show()
+
+    def write_locked(self, i2c):
+        """Write the display buffer on an I2C bus the caller has already locked"""
+        i2c.writeto(self.i2c_device[0].device_address, self._buffer)
+
+
 class SimpleTideDisplay:
     def __init__(self):
         self.pool = None          # Socket pool for NTP re-sync
+        self.requests = None      # HTTP session, kept for the life of the process
         self.last_ntp_sync = None # Track last NTP sync date
         self._wdt_feed_warned = False  # One-shot log guard for WDT feed errors
+        self._frames = [bytearray(16) for _ in range(3)]  # One frame per matrix
+        self._i2c = None
+        self._chart_levels = None  # Levels of the chart currently shown, None if another screen is up
+        self._chart_plane = None   # Color plane of that chart (0 = green/stale, 1 = red)
+        self._chart_hour = None    # Hour highlighted on that chart
+        # Only the date changes between NOAA requests, so build the rest of
+        # the query once and cache the full URL per day
+        self._url_template = (API_URL + f"?station={TIDE_STATION}&product=predictions&datum=MLLW"
+                              "&time_zone=lst&interval=h&units=english&format=json"
+                              "&begin_date={0}&end_date={0}")
+        self._url_date = None     # (year, month, day) the cached URL is for
+        self._url = None
+        self._last_time_strs = []  # Timestamps of the last parse, only used by the ASCII chart
         self.setup_watchdog()
         self.setup_matrices()
         self.setup_network()
@@ -114,11 +195,14 @@ class SimpleTideDisplay:
         try:
             print("Setting up LED matrices...")
             i2c = board.I2C()
+            self._i2c = i2c  # Kept so flush_all() can write all matrices under one bus lock
             
-            # Initialize the three 8x8 matrices with brightness parameter
-            self.matrix1 = Matrix8x8x2(i2c, address=0x70, brightness=LED_BRIGHTNESS)  # First 8 hours (left)
-            self.matrix2 = Matrix8x8x2(i2c, address=0x71, brightness=LED_BRIGHTNESS)  # Middle 8 hours (center) 
-            self.matrix3 = Matrix8x8x2(i2c, address=0x72, brightness=LED_BRIGHTNESS)  # Last 8 hours (right)
+            # Initialize the three 8x8 matrices with brightness parameter.
+            # auto_write is off so pixel changes are batched and pushed with show()/blit()
+            # instead of one I2C write per pixel.
+            self.matrix1 = TideMatrix(i2c, address=0x70, auto_write=False, brightness=LED_BRIGHTNESS)  # First 8 hours (left)
+            self.matrix2 = TideMatrix(i2c, address=0x71, auto_write=False, brightness=LED_BRIGHTNESS)  # Middle 8 hours (center) 
+            self.matrix3 = TideMatrix(i2c, address=0x72, auto_write=False, brightness=LED_BRIGHTNESS)  # Last 8 hours (right)
             
             print(f"LED brightness set to {LED_BRIGHTNESS:.2f}")
             
@@ -129,6 +213,7 @@ class SimpleTideDisplay:
             self.matrix1[0, 0] = self.matrix1.LED_GREEN
             self.matrix2[0, 0] = self.matrix2.LED_GREEN
             self.matrix3[0, 0] = self.matrix3.LED_GREEN
+            self.show_matrices()
             print("LED matrices initialized successfully")
             self.dump_display("boot: matrices alive")
             
@@ -147,6 +232,7 @@ class SimpleTideDisplay:
             if has_matrices:
                 self.matrix1[0, 0] = self.matrix1.LED_GREEN   # Stage 1 done
                 self.matrix2[0, 0] = self.matrix2.LED_YELLOW  # WiFi in progress
+                self.show_matrices()
                 self.dump_display("boot: wifi connecting")
 
             print("Connecting to WiFi...")
@@ -156,14 +242,15 @@ class SimpleTideDisplay:
             # Stage 2 done — WiFi connected
             if has_matrices:
                 self.matrix2[0, 0] = self.matrix2.LED_GREEN
+                self.matrix2.show()
                 self.dump_display("boot: wifi connected")
 
-            self.pool = socketpool.SocketPool(wifi.radio)
-            self.requests = adafruit_requests.Session(self.pool, ssl.create_default_context())
+            self.ensure_session()
             
             # Stage 3: NTP syncing — yellow on matrix3
             if has_matrices:
                 self.matrix3[0, 0] = self.matrix3.LED_YELLOW
+                self.matrix3.show()
                 self.dump_display("boot: ntp syncing")
 
             print("Syncing NTP...")
@@ -173,6 +260,7 @@ class SimpleTideDisplay:
             # Stage 3 done — all green
             if has_matrices:
                 self.matrix3[0, 0] = self.matrix3.LED_GREEN
+                self.matrix3.show()
                 self.dump_display("boot: all stages green")
 
             time.sleep(1)  # Brief pause so you can see all-green
@@ -190,8 +278,34 @@ class SimpleTideDisplay:
                 for m in [self.matrix1, self.matrix2, self.matrix3]:
                     if m[0, 0] != m.LED_GREEN:
                         m[0, 0] = m.LED_RED
+                self.show_matrices()
                 self.dump_display("boot: setup error")
             
+    def reset_sockets(self):
+        """Close every socket held for the pool and drop the session.
+
+        adafruit_requests keeps sockets in one ConnectionManager per pool, so
+        a new Session on the same pool would see the same (possibly dead or
+        half-used) sockets; they have to be closed at the manager.
+        """
+        if self.pool is not None:
+            try:
+                adafruit_connection_manager.connection_manager_close_all(self.pool)
+            except RuntimeError:
+                pass  # No request has been made on this pool yet
+        self.requests = None
+
+    def ensure_session(self):
+        """Create the requests session if there is none, reusing the cached socket pool.
+
+        Reusing the pool means reusing its sockets, so callers recovering from
+        a socket error must go through reset_sockets() first.
+        """
+        if self.pool is None:
+            self.pool = socketpool.SocketPool(wifi.radio)
+        if self.requests is None:
+            self.requests = adafruit_requests.Session(self.pool, SSL_CONTEXT)
+
     def check_wifi_connection(self):
         """Check if WiFi is still connected"""
         try:
@@ -206,9 +320,10 @@ class SimpleTideDisplay:
                 print(f"WiFi reconnection attempt {attempt + 1}/{max_attempts}...")
                 wifi.radio.connect(WIFI_SSID, WIFI_PASSWORD)
 
-                # Recreate the requests session with new socket pool
-                self.pool = socketpool.SocketPool(wifi.radio)
-                self.requests = adafruit_requests.Session(self.pool, ssl.create_default_context())
+                # Sockets opened before the drop are dead; close them before
+                # rebuilding the session (the pool and SSL context are reused)
+                self.reset_sockets()
+                self.ensure_session()
 
                 print(f"WiFi reconnected successfully to {WIFI_SSID}")
                 return True
@@ -216,10 +331,10 @@ class SimpleTideDisplay:
             except Exception as e:
                 print(f"WiFi reconnection attempt {attempt + 1} failed: {e}")
                 if attempt < max_attempts - 1:
-                    wait = 5 * (attempt + 1)
-                    for _ in range(wait):
-                        self.feed_watchdog()
-                        time.sleep(1)
+                    # Capped exponential backoff with jitter so devices recovering
+                    # from the same outage don't retry in lockstep
+                    wait = min(60, 5 * (1 << attempt)) + random.uniform(0, 5)
+                    self.sleep_with_watchdog(wait)
                     
         print("WiFi reconnection failed after all attempts")
         return False
@@ -232,9 +347,7 @@ class SimpleTideDisplay:
                 return False
                 
             # Try to recreate session if needed
-            if not hasattr(self, 'requests') or self.requests is None:
-                self.pool = socketpool.SocketPool(wifi.radio)
-                self.requests = adafruit_requests.Session(self.pool, ssl.create_default_context())
+            self.ensure_session()
                 
             return True
             
@@ -273,9 +386,18 @@ class SimpleTideDisplay:
                 print(f"Watchdog feed failed (further errors suppressed): {e}")
                 self._wdt_feed_warned = True
 
-    def maybe_resync_ntp(self):
+    def sleep_with_watchdog(self, seconds):
+        """Light-sleep for the given (possibly fractional) seconds, waking every 10s to feed the watchdog"""
+        while seconds > 0:
+            self.feed_watchdog()
+            step = min(10, seconds)
+            alarm.light_sleep_until_alarms(alarm.time.TimeAlarm(monotonic_time=time.monotonic() + step))
+            seconds -= step
+
+    def maybe_resync_ntp(self, current_time=None):
         """Re-sync NTP daily at 3 AM to prevent clock drift"""
-        current_time = time.localtime()
+        if current_time is None:
+            current_time = time.localtime()
         if current_time.tm_hour == 3 and self.last_ntp_sync != current_time.tm_mday:
             print("Daily NTP re-sync triggered...")
             try:
@@ -362,6 +484,8 @@ class SimpleTideDisplay:
         # Matrix 3: day (DD) in green, centered
         self._draw_string(self.matrix3, day_str, 1, self.matrix3.LED_GREEN)
 
+        self.show_matrices()
+
         print(f"Boot display: {month_str} / {day_str}")
         self.dump_display(f"boot: date {month_str}/{day_str}")
         print("Showing date for 3 seconds...")
@@ -376,12 +500,15 @@ class SimpleTideDisplay:
         # Matrix 3: minutes (MM) in green, centered
         self._draw_string(self.matrix3, min_str, 1, self.matrix3.LED_GREEN)
 
+        self.show_matrices()
+
         print(f"Boot display: {hour_str} : {min_str}")
         self.dump_display(f"boot: time {hour_str}:{min_str}")
         print("Showing time for 3 seconds...")
         time.sleep(3)
 
         self.clear_matrices()
+        self.show_matrices()
         self.dump_display("boot: cleared")
         print("Boot sequence complete, loading tide data...")
             
@@ -398,12 +525,19 @@ class SimpleTideDisplay:
             self.matrix1[7, 7] = self.matrix1.LED_RED
         elif status == 'clear':
             self.matrix1[7, 7] = 0
+        self._chart_levels = None
+        self.matrix1.show()
         self.dump_display(f"api status: {status}")
 
     def fetch_tide_data(self, max_retries=3):
         """Fetch tide data from NOAA API with retry logic"""
         last_error = None
         
+        # Print current date and time once per fetch, not per attempt
+        now = time.localtime()
+        print(f"Current time: {now.tm_year}-{now.tm_mon:02d}-{now.tm_mday:02d} "
+              f"{now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}")
+        
         for attempt in range(max_retries):
             try:
                 # Check WiFi connection first
@@ -413,50 +547,62 @@ class SimpleTideDisplay:
                         raise Exception("WiFi reconnection failed")
                 
                 # Ensure we have a valid requests session
-                if not hasattr(self, 'requests') or self.requests is None:
+                if self.requests is None:
                     print("Creating new requests session...")
-                    self.pool = socketpool.SocketPool(wifi.radio)
-                    self.requests = adafruit_requests.Session(self.pool, ssl.create_default_context())
+                    self.ensure_session()
                 
-                # Get current date in YYYYMMDD format
-                current_time = time.localtime()
-                date_str = f"{current_time.tm_year:04d}{current_time.tm_mon:02d}{current_time.tm_mday:02d}"
+                # Re-read the clock per attempt; a long backoff can cross midnight
+                now = time.localtime()
                 
-                # Build API URL with parameters
-                params = {
-                    "begin_date": date_str,
-                    "end_date": date_str,
-                    "station": TIDE_STATION,  # Use configurable station
-                    "product": "predictions",
-                    "datum": "MLLW",
-                    "time_zone": "lst",
-                    "interval": "h",
-                    "units": "english",
-                    "format": "json"
-                }
-                
-                # Construct URL with parameters
-                url_with_params = API_URL + "?" + "&".join([f"{k}={v}" for k, v in params.items()])
-                
-                # Print current date and time
-                current_time = time.localtime()
-                print(f"Current time: {current_time.tm_year}-{current_time.tm_mon:02d}-{current_time.tm_mday:02d} "
-                      f"{current_time.tm_hour:02d}:{current_time.tm_min:02d}:{current_time.tm_sec:02d}")
+                # Rebuild the URL only when the date has changed
+                current_date = (now.tm_year, now.tm_mon, now.tm_mday)
+                if current_date != self._url_date:
+                    # Date in YYYYMMDD format
+                    date_str = "%04d%02d%02d" % (now.tm_year, now.tm_mon, now.tm_mday)
+                    self._url = self._url_template.format(date_str)
+                    self._url_date = current_date
+                url_with_params = self._url
                 
                 print(f"Fetching tide data (attempt {attempt + 1}/{max_retries})...")
                 print(f"URL: {url_with_params}")
                 
-                response = self.requests.get(url_with_params, timeout=30)
+                # Keep the TLS connection open so the next poll can reuse it
+                response = self.requests.get(url_with_params, headers={"Connection": "keep-alive"}, timeout=30)
                 
                 try:
                     if response.status_code == 200:
+                        # json() parses straight off the socket; reading .content
+                        # first would hold the whole body in RAM as well
                         data = response.json()
                         print("Tide data received successfully")
-                        return self.parse_tide_data(data)
+                        tide_data = self.parse_tide_data(data)
+                        del data  # The response's cached copy is cleared in finally
+                        return tide_data
                     else:
-                        raise Exception(f"API request failed with status: {response.status_code}, Response: {response.text}")
+                        # Read at most the first 200 bytes of the error page. Each
+                        # iter_content chunk can be short (the first is whatever
+                        # was left in the header buffer), so collect until full.
+                        body = bytearray()
+                        for chunk in response.iter_content(64):
+                            body.extend(chunk)
+                            if len(body) >= 200:
+                                break
+                        body = bytes(body[:200])
+                        # At EOF iter_content already closed the response. Otherwise
+                        # the rest of the body is unread and the keep-alive socket
+                        # is out of sync: close it for real (close() would hand it
+                        # back for reuse) and drop the session.
+                        if response.socket is not None:
+                            adafruit_connection_manager.get_connection_manager(self.pool).close_socket(response.socket)
+                            response.socket = None
+                            self.requests = None
+                        raise Exception(f"API request failed with status: {response.status_code}, Response: {body}")
                 finally:
                     response.close()
+                    # json() keeps the decoded dict on the response, which the
+                    # session also holds as its last response until the next
+                    # request; drop it so the gc.collect() can reclaim it
+                    response._cached = None
                     gc.collect()
                     print(f"Free memory after fetch: {gc.mem_free()} bytes")
                     
@@ -464,128 +610,204 @@ class SimpleTideDisplay:
                 last_error = e
                 print(f"Attempt {attempt + 1} failed: {e}")
                 
-                # On socket errors, try to recreate the session
-                if "socket" in str(e).lower():
-                    print("Socket error detected, recreating session...")
-                    try:
-                        self.pool = socketpool.SocketPool(wifi.radio)
-                        self.requests = adafruit_requests.Session(self.pool, ssl.create_default_context())
-                    except Exception as session_error:
-                        print(f"Session recreation failed: {session_error}")
+                # Socket trouble (including a socket left registered by a failed
+                # request, which surfaces as RuntimeError "already connected")
+                # needs the pool's sockets closed, not just a new session
+                if isinstance(e, (OSError, adafruit_requests.OutOfRetries, RuntimeError)):
+                    print("Socket error detected, closing sockets and rebuilding session")
+                    self.reset_sockets()
                 
                 if attempt < max_retries - 1:
-                    # Exponential backoff: 30s, 60s, 120s
-                    wait_time = 30 * (2 ** attempt)
-                    print(f"Waiting {wait_time} seconds before retry...")
-                    for _ in range(wait_time // 10):
-                        self.feed_watchdog()
-                        time.sleep(10)
+                    # Exponential backoff (30s, 60s, 120s, capped at 30 min) plus
+                    # up to 15s of jitter to avoid synchronized retries
+                    wait_time = min(1800, 30 * (2 ** attempt)) + random.uniform(0, 15)
+                    print(f"Waiting {wait_time:.0f} seconds before retry...")
+                    self.sleep_with_watchdog(wait_time)
                     
         print(f"All {max_retries} attempts failed. Last error: {last_error}")
         return None
     
     def parse_tide_data(self, data):
-        """Parse tide data and extract hourly predictions"""
+        """Parse tide data into (values, levels) for the hourly predictions.
+
+        A single pass collects the water heights, as integer thousandths of
+        a foot (NOAA's precision), and tracks the min/max as it goes; the
+        heights are then normalized straight from that compact array, so no
+        per-reading tuples are built. The timestamps are only needed by the
+        ASCII chart, so they are kept in self._last_time_strs and only when
+        DEBUG_ASCII is on.
+        """
         try:
             predictions = data.get('predictions', [])
             if not predictions:
                 print("No tide predictions found in response")
                 return None
             
-            tide_levels = []
+            times = []
+            values = array('i')
+            min_level = max_level = None
             for prediction in predictions:
-                # Extract tide level (water height in feet)
-                level = float(prediction.get('v', 0))
-                time_str = prediction.get('t', '')
-                tide_levels.append((time_str, level))
+                # Extract tide level (water height in thousandths of a foot)
+                level = round(float(prediction.get('v', 0)) * 1000)
+                if DEBUG_ASCII:
+                    times.append(prediction.get('t', ''))
+                values.append(level)
+                if min_level is None:
+                    min_level = max_level = level
+                elif level < min_level:
+                    min_level = level
+                elif level > max_level:
+                    max_level = level
             
-            print(f"Parsed {len(tide_levels)} tide level readings")
-            return tide_levels
+            print(f"Parsed {len(values)} tide level readings")
+            self._last_time_strs = times
+            return values, self.normalize_tide_levels(values, min_level, max_level)
             
         except Exception as e:
             print(f"Error parsing tide data: {e}")
             return None
     
-    def normalize_tide_levels(self, tide_levels):
-        """Normalize tide levels to chart height (0-7)"""
-        if not tide_levels:
-            return []
-        
-        # Extract just the numeric values for normalization
-        values = [level for _, level in tide_levels]
-        
-        min_level = min(values)
-        max_level = max(values)
+    def normalize_tide_levels(self, values, min_level, max_level):
+        """Normalize integer tide levels to chart height (0-7), one byte per reading.
+
+        Integer-only math: scaling by 7 before the floor divide gives the
+        same result as int((level - min) / range * 7) without float work.
+        """
         level_range = max_level - min_level
         
         if level_range == 0:
             # All levels are the same
-            return [(time_str, 4) for time_str, _ in tide_levels]  # Middle of chart
+            return array('B', [_MID] * len(values))  # Middle of chart
         
-        normalized = []
-        for time_str, level in tide_levels:
-            # Normalize to 0-7 range
-            norm_level = int(((level - min_level) / level_range) * 7)
-            # Clamp to valid range
-            norm_level = max(0, min(7, norm_level))
-            normalized.append((time_str, norm_level))
+        normalized = array('B')
+        append = normalized.append
+        for level in values:
+            # Normalize to 0-7 range; min <= level <= max keeps it in range
+            append(((level - min_level) * _MAX) // level_range)
         
         return normalized
     
     def clear_matrices(self):
-        """Clear all LED matrices"""
+        """Clear all LED matrix buffers (call show_matrices() to display)"""
+        self._chart_levels = None
         if self.matrix1:
             self.matrix1.fill(0)
         if self.matrix2:
             self.matrix2.fill(0)
         if self.matrix3:
             self.matrix3.fill(0)
+
+    def show_matrices(self):
+        """Push all LED matrix buffers to the displays"""
+        self._chart_levels = None
+        if self.matrix1 and self.matrix2 and self.matrix3:
+            self.flush_all()
+            return
+        if self.matrix1:
+            self.matrix1.show()
+        if self.matrix2:
+            self.matrix2.show()
+        if self.matrix3:
+            self.matrix3.show()
+
+    def flush_all(self):
+        """Write all three display buffers back-to-back under a single I2C bus lock"""
+        i2c = self._i2c
+        while not i2c.try_lock():
+            pass
+        try:
+            self.matrix1.write_locked(i2c)
+            self.matrix2.write_locked(i2c)
+            self.matrix3.write_locked(i2c)
+        finally:
+            i2c.unlock()
+
+    def blit_frames(self, frames=None):
+        """Write three frames (default: the chart frames) to the matrices in one bus transaction"""
+        if frames is None:
+            frames = self._frames
+        else:
+            self._chart_levels = None
+        self.matrix1.load(frames[0])
+        self.matrix2.load(frames[1])
+        self.matrix3.load(frames[2])
+        self.flush_all()
+
+    def _paint_chart(self, levels, current_hour, plane):
+        """Paint the 24-hour chart into the frames.
+
+        Every hour lights one pixel at its level on the given color plane
+        (0 = green, 1 = red); the current hour lights both planes (yellow).
+        """
+        frames = self._frames
+        for frame in frames:
+            frame[:] = BLANK_FRAME
+
+        for hour in range(min(24, len(levels))):
+            level = levels[hour]
+            # Matrix1 holds hours 0-7, Matrix2 8-15, Matrix3 16-23;
+            # x is the hour within the group, y is the tide level (0-7)
+            frame = frames[hour >> 3]
+            col = (hour & 7) << 1
+            bit = 1 << level
+            if hour == current_hour:
+                frame[col] |= bit
+                frame[col + 1] |= bit
+            else:
+                frame[col + plane] |= bit
+
+        self._chart_levels = levels
+        self._chart_plane = plane
+        self._chart_hour = current_hour
+
+    def _move_highlight(self, levels, current_hour, plane):
+        """Move the yellow highlight on the chart that is already displayed.
+
+        Only the previous and new hour change, so this edits two bits and
+        rewrites at most two matrices. Returns False when the matrices show
+        something else and the chart needs a full repaint.
+        """
+        if levels is not self._chart_levels or plane != self._chart_plane:
+            return False
+
+        frames = self._frames
+        matrices = (self.matrix1, self.matrix2, self.matrix3)
+        other_plane = 1 - plane  # Adding this plane to the base color makes yellow
+        hours = min(24, len(levels))
+        prev_hour = self._chart_hour
+        dirty = []
+        if prev_hour is not None and 0 <= prev_hour < hours:
+            frames[prev_hour >> 3][((prev_hour & 7) << 1) + other_plane] &= ~(1 << levels[prev_hour])
+            dirty.append(prev_hour >> 3)
+        if 0 <= current_hour < hours:
+            frames[current_hour >> 3][((current_hour & 7) << 1) + other_plane] |= 1 << levels[current_hour]
+            if (current_hour >> 3) not in dirty:
+                dirty.append(current_hour >> 3)
+        for idx in dirty:
+            matrices[idx].blit(frames[idx])
+
+        self._chart_hour = current_hour
+        return True
     
-    def display_on_matrices(self, tide_data):
+    def display_on_matrices(self, tide_data, current_hour=None):
         """Display tide chart on the LED matrices"""
         if not tide_data or not (self.matrix1 and self.matrix2 and self.matrix3):
             print("Cannot display on matrices - data or matrices not available")
             return
             
-        normalized_data = self.normalize_tide_levels(tide_data)
-        
-        # Get current hour for highlighting
-        current_time = time.localtime()
-        current_hour = current_time.tm_hour
-        
-        # Clear matrices first
-        self.clear_matrices()
+        levels = tide_data[1]
         
-        # Split data into 3 groups of 8 hours each
-        matrices = [self.matrix1, self.matrix2, self.matrix3]
+        # Get current hour for highlighting, unless the caller already has it
+        if current_hour is None:
+            current_hour = time.localtime().tm_hour
         
-        for matrix_idx, matrix in enumerate(matrices):
-            start_hour = matrix_idx * 8
-            end_hour = start_hour + 8
-            
-            # Get the data for this 8-hour period
-            matrix_data = normalized_data[start_hour:end_hour]
-            
-            for hour_offset, (time_str, level) in enumerate(matrix_data):
-                if hour_offset >= 8:  # Safety check
-                    break
-                    
-                # Matrix coordinates: [x, y] where x is hour (0-7), y is tide level (0-7)
-                # Matrix1: x=0 is midnight, x=1 is 1AM, etc.
-                # Matrix2: x=0 is 8AM, x=1 is 9AM, etc. 
-                # Matrix3: x=0 is 4PM, x=1 is 5PM, etc.
-                matrix_x = hour_offset  # Direct mapping: 0-7 for each matrix
-                
-                # Calculate the actual hour this represents
-                actual_hour = start_hour + hour_offset
-                
-                # Display single LED point at the tide level for this hour
-                # Use yellow for current hour, red for all others
-                if actual_hour == current_hour:
-                    matrix[matrix_x, level] = matrix.LED_YELLOW  # Current hour in yellow
-                    print(f"Current hour ({current_hour}:00) highlighted in yellow on matrix {matrix_idx + 1}")
-                else:
-                    matrix[matrix_x, level] = matrix.LED_RED     # Other hours in red
+        # Between hourly redraws of the same chart only the highlight moves
+        if not self._move_highlight(levels, current_hour, 1):
+            # Red for all hours, yellow for the current one
+            self._paint_chart(levels, current_hour, 1)
+            self.blit_frames()
+        if 0 <= current_hour < min(24, len(levels)):
+            print(f"Current hour ({current_hour}:00) highlighted in yellow on matrix {(current_hour >> 3) + 1}")
 
         print("Tide data displayed on LED matrices")
         self.dump_display(f"tide chart (current hour {current_hour:02d})")
@@ -595,14 +817,8 @@ class SimpleTideDisplay:
         if not (self.matrix1 and self.matrix2 and self.matrix3):
             return
             
-        # Clear matrices
-        self.clear_matrices()
-        
         # Show red X pattern on middle matrix to indicate error
-        matrix = self.matrix2
-        for i in range(8):
-            matrix[i, i] = matrix.LED_RED      # Main diagonal
-            matrix[i, 7-i] = matrix.LED_RED    # Counter diagonal
+        self.blit_frames((BLANK_FRAME, ERROR_FRAME, BLANK_FRAME))
 
         print("Error pattern displayed on LED matrices")
         self.dump_display("error X pattern")
@@ -612,48 +828,25 @@ class SimpleTideDisplay:
         if not (self.matrix1 and self.matrix2 and self.matrix3):
             return
             
-        # Clear matrices
-        self.clear_matrices()
-        
-        # Show yellow warning pattern on all matrices
-        matrices = [self.matrix1, self.matrix2, self.matrix3]
-        for matrix in matrices:
-            # Show blinking border pattern
-            for i in range(8):
-                matrix[0, i] = matrix.LED_YELLOW    # Top row
-                matrix[7, i] = matrix.LED_YELLOW    # Bottom row
-                matrix[i, 0] = matrix.LED_YELLOW    # Left column
-                matrix[i, 7] = matrix.LED_YELLOW    # Right column
+        # Show yellow border pattern on all matrices
+        self.blit_frames((SAFE_MODE_FRAME, SAFE_MODE_FRAME, SAFE_MODE_FRAME))
 
         print("Safe mode pattern displayed on LED matrices")
         self.dump_display("safe mode border")
     
-    def display_on_matrices_stale(self, tide_data):
+    def display_on_matrices_stale(self, tide_data, current_hour=None):
         """Display tide data with stale indicator (green dots instead of red)"""
         if not tide_data or not (self.matrix1 and self.matrix2 and self.matrix3):
             return
             
-        normalized_data = self.normalize_tide_levels(tide_data)
-        current_time = time.localtime()
-        current_hour = current_time.tm_hour
+        levels = tide_data[1]
+        if current_hour is None:
+            current_hour = time.localtime().tm_hour
         
-        self.clear_matrices()
-        
-        matrices = [self.matrix1, self.matrix2, self.matrix3]
-        
-        for matrix_idx, matrix in enumerate(matrices):
-            start_hour = matrix_idx * 8
-            matrix_data = normalized_data[start_hour:start_hour + 8]
-            
-            for hour_offset, (time_str, level) in enumerate(matrix_data):
-                if hour_offset >= 8:
-                    break
-                actual_hour = start_hour + hour_offset
-                # Use green for all points to indicate stale/yesterday's data
-                if actual_hour == current_hour:
-                    matrix[hour_offset, level] = matrix.LED_YELLOW
-                else:
-                    matrix[hour_offset, level] = matrix.LED_GREEN
+        # Use green for all points to indicate stale/yesterday's data
+        if not self._move_highlight(levels, current_hour, 0):
+            self._paint_chart(levels, current_hour, 0)
+            self.blit_frames()
 
         print("Stale tide data displayed on LED matrices (green = yesterday's data)")
         self.dump_display(f"stale tide (current hour {current_hour:02d})")
@@ -680,10 +873,11 @@ class SimpleTideDisplay:
                 current_date = (current_time.tm_year, current_time.tm_mon, current_time.tm_mday)
                 
                 # Daily NTP re-sync at 3 AM
-                self.maybe_resync_ntp()
+                self.maybe_resync_ntp(current_time)
                 
-                # Check WiFi status periodically
-                if not self.check_wifi_connection():
+                # Check WiFi status on hour changes only; fetch_tide_data re-checks
+                # before every attempt, and safe mode already assumes the link is bad
+                if current_hour != last_hour and not in_safe_mode and not self.check_wifi_connection():
                     print("WiFi connection lost, attempting to reconnect...")
                     if self.reconnect_wifi():
                         consecutive_failures = 0  # Reset failure count on successful reconnect
@@ -712,7 +906,8 @@ class SimpleTideDisplay:
                         last_hour = -1
 
                         # Display on serial console when we get new data
-                        self.display_ascii_chart(tide_data)
+                        if DEBUG_ASCII:
+                            self.display_ascii_chart(tide_data)
                         print("Tide data will refresh again after midnight...")
                     else:
                         consecutive_failures += 1
@@ -730,7 +925,7 @@ class SimpleTideDisplay:
                             self.show_safe_mode_on_matrices()
                         elif data_is_stale and tide_data is not None:
                             # Show yesterday's data in green as a stale indicator
-                            self.display_on_matrices_stale(tide_data)
+                            self.display_on_matrices_stale(tide_data, current_hour)
                             last_hour = current_hour
                         else:
                             self.show_error_on_matrices()
@@ -745,30 +940,37 @@ class SimpleTideDisplay:
                             
                         print(f"Retrying in {retry_delay // 60} minutes...")
                         # Feed watchdog during long retry waits
-                        for _ in range(retry_delay // 10):
-                            self.feed_watchdog()
-                            time.sleep(10)
+                        self.sleep_with_watchdog(retry_delay)
                         continue
                 
                 # Check if the hour has changed and we have tide data
                 if current_hour != last_hour and tide_data is not None:
                     print(f"Hour changed from {last_hour} to {current_hour}, updating matrix display...")
+                    print(f"Current time: {current_time.tm_year}-{current_time.tm_mon:02d}-{current_time.tm_mday:02d} "
+                          f"{current_time.tm_hour:02d}:{current_time.tm_min:02d}:{current_time.tm_sec:02d}")
                     if data_is_stale:
-                        self.display_on_matrices_stale(tide_data)
+                        self.display_on_matrices_stale(tide_data, current_hour)
                     else:
-                        self.display_on_matrices(tide_data)
+                        self.display_on_matrices(tide_data, current_hour)
                     last_hour = current_hour
                 
                 # In safe mode, show different pattern periodically
                 if in_safe_mode:
                     self.show_safe_mode_on_matrices()
                 
-                # Sleep for 30 seconds before checking again
-                # Feed watchdog and collect garbage during sleep
+                # Nothing changes until the next hour boundary (new highlight,
+                # new day, NTP re-sync), so sleep until then instead of polling.
+                # Safe mode keeps a 60s wake.
                 gc.collect()
-                for _ in range(3):
-                    self.feed_watchdog()
-                    time.sleep(10)
+                if in_safe_mode:
+                    sleep_secs = 60
+                else:
+                    # Re-read the clock here rather than reusing current_time: a
+                    # slow pass (fetch retries, NTP resync) would otherwise push
+                    # the wake, and the highlight move, past the hour
+                    now = time.localtime()
+                    sleep_secs = 3600 - (now.tm_min * 60 + now.tm_sec)
+                self.sleep_with_watchdog(sleep_secs)
                 
             except Exception as e:
                 print(f"Error in main loop: {e}")
@@ -779,9 +981,7 @@ class SimpleTideDisplay:
                 error_delay = min(300 * consecutive_failures, 1800)  # Max 30 minutes
                 print(f"Waiting {error_delay // 60} minutes before retry...")
                 # Feed watchdog during long error waits
-                for _ in range(error_delay // 10):
-                    self.feed_watchdog()
-                    time.sleep(10)
+                self.sleep_with_watchdog(error_delay)
     
     def display_ascii_chart(self, tide_data):
         """Display tide chart as ASCII art in console"""
@@ -789,42 +989,42 @@ class SimpleTideDisplay:
             print("No tide data to display")
             return
         
-        normalized_data = self.normalize_tide_levels(tide_data)
+        values, levels = tide_data
+        times = self._last_time_strs
+        chart_levels = levels[:24]  # Limit to 24 hours
         
         print("\n" + "="*60)
         print("24-HOUR TIDE CHART")
         print("="*60)
         
-        # Print the chart (8 rows, inverted so high tide is at top)
+        # Print the chart (8 rows, inverted so high tide is at top).
+        # Cells are collected in a list and joined once per row rather than
+        # growing the line with += (which copies it every time)
         for row in range(7, -1, -1):
-            line = f"{row} |"
-            for time_str, level in normalized_data[:24]:  # Limit to 24 hours
-                if level >= row:
-                    line += "██"  # Unicode block character
-                else:
-                    line += "  "
-            print(line)
+            parts = [f"{row} |"]
+            append = parts.append
+            for level in chart_levels:
+                append("██" if level >= row else "  ")  # Unicode block character
+            print("".join(parts))
         
         # Print bottom border
-        print("  +" + "─" * (len(normalized_data[:24]) * 2))
+        print("  +" + "─" * (len(chart_levels) * 2))
         
         # Print hour labels (every 4 hours)
-        hour_line = "   "
-        for i, (time_str, _) in enumerate(normalized_data[:24]):
+        hour_parts = ["   "]
+        for i, time_str in enumerate(times[:24]):
             if i % 4 == 0:
-                try:
-                    hour = time_str.split(' ')[1].split(':')[0]
-                except (IndexError, AttributeError):
-                    hour = "??"
-                hour_line += f"{hour:>2}"
+                # "YYYY-MM-DD HH:MM" - slice the hour rather than splitting
+                hour = time_str[11:13] or "??"
+                hour_parts.append(f"{hour:>2}")
             else:
-                hour_line += "  "
-        print(hour_line)
+                hour_parts.append("  ")
+        print("".join(hour_parts))
         
         date_label = "Unknown"
-        if normalized_data:
+        if times:
             try:
-                date_label = normalized_data[0][0].split(' ')[0]
+                date_label = times[0].split(' ')[0]
             except (IndexError, AttributeError):
                 pass
         print(f"\nDate: {date_label}")
@@ -834,8 +1034,8 @@ class SimpleTideDisplay:
         
         # Print raw data for reference
         print("\nRAW TIDE DATA:")
-        for time_str, level in tide_data[:24]:
-            print(f"{time_str}: {level:.2f} ft")
+        for i in range(min(24, len(times))):
+            print(f"{times[i]}: {values[i] / 1000:.2f} ft")
     
     def run_once(self):
         """Run the tide display once (for testing)"""
@@ -846,7 +1046,8 @@ class SimpleTideDisplay:
         if tide_data:
             self.show_api_status('ok')
             # Display on both serial console and LED matrices
-            self.display_ascii_chart(tide_data)
+            if DEBUG_ASCII:
+                self.display_ascii_chart(tide_data)
             self.display_on_matrices(tide_data)
         else:
             self.show_api_status('fail')
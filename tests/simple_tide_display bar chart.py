@@ -1,30 +1,27 @@
 # This was the first basic functioning code in the proejct.  
 # The API reads the tide information and displays it in a bar chart both on the serial interface and on the matix displays.  
 # It's a bar chart display so a bit different than the goal I have in mind but it might be useful for someone that just wants the tide chart with multiple colors. 
+# Needs tide_core.py copied alongside it.
 
-import wifi
-import socketpool
-import ssl
-import adafruit_requests
-import json
-import time
 import board
 from adafruit_ht16k33.matrix import Matrix8x8x2
 import os
+from tide_core import SimpleTideDisplay
 
 # Load WiFi credentials from settings.toml
 WIFI_SSID = os.getenv('WIFI_SSID')
 WIFI_PASSWORD = os.getenv('WIFI_PASSWORD')
-TIDE_STATION = os.getenv('TIDE_STATION', '8726724')  # Default to St. Petersburg, FL
-UPDATE_INTERVAL = int(os.getenv('UPDATE_INTERVAL', '3600'))  # Default to 1 hour
 
-# NOAA API endpoint
-API_URL = "https://api.tidesandcurrents.noaa.gov/api/prod/datagetter"
+# Matrix colors, read off the class once rather than per lit pixel
+LED_RED = Matrix8x8x2.LED_RED
+LED_YELLOW = Matrix8x8x2.LED_YELLOW
+LED_GREEN = Matrix8x8x2.LED_GREEN
 
-class SimpleTideDisplay:
+class BarChartTideDisplay(SimpleTideDisplay):
+    """SimpleTideDisplay plus a colored bar chart on the three LED matrices"""
     def __init__(self):
         self.setup_matrices()
-        self.setup_network()
+        super().__init__(WIFI_SSID, WIFI_PASSWORD)
         
     def setup_matrices(self):
         """Initialize the LED matrices"""
@@ -32,10 +29,11 @@ class SimpleTideDisplay:
             print("Setting up LED matrices...")
             i2c = board.I2C()
             
-            # Initialize the three 8x8 matrices
-            self.matrix1 = Matrix8x8x2(i2c, address=0x70)  # First 8 hours (left)
-            self.matrix2 = Matrix8x8x2(i2c, address=0x71)  # Middle 8 hours (center) 
-            self.matrix3 = Matrix8x8x2(i2c, address=0x72)  # Last 8 hours (right)
+            # Initialize the three 8x8 matrices. auto_write is off so pixel
+            # writes only touch the framebuffer; show() sends each matrix once.
+            self.matrix1 = Matrix8x8x2(i2c, address=0x70, auto_write=False)  # First 8 hours (left)
+            self.matrix2 = Matrix8x8x2(i2c, address=0x71, auto_write=False)  # Middle 8 hours (center) 
+            self.matrix3 = Matrix8x8x2(i2c, address=0x72, auto_write=False)  # Last 8 hours (right)
             
             # Clear all matrices
             self.clear_matrices()
@@ -47,130 +45,29 @@ class SimpleTideDisplay:
             self.matrix2 = None
             self.matrix3 = None
         
-    def setup_network(self):
-        """Initialize WiFi connection and requests session"""
-        try:
-            print("Connecting to WiFi...")
-            wifi.radio.connect(WIFI_SSID, WIFI_PASSWORD)
-            print(f"Connected to {WIFI_SSID}")
-            
-            pool = socketpool.SocketPool(wifi.radio)
-            self.requests = adafruit_requests.Session(pool, ssl.create_default_context())
-            
-        except Exception as e:
-            print(f"Network setup failed: {e}")
-            
-    def fetch_tide_data(self):
-        """Fetch tide data from NOAA API"""
-        try:
-            # Get current date in YYYYMMDD format
-            current_time = time.localtime()
-            date_str = f"{current_time.tm_year:04d}{current_time.tm_mon:02d}{current_time.tm_mday:02d}"
-            
-            # Build API URL with parameters
-            params = {
-                "begin_date": date_str,
-                "end_date": date_str,
-                "station": TIDE_STATION,  # Use configurable station
-                "product": "predictions",
-                "datum": "MLLW",
-                "time_zone": "lst",
-                "interval": "h",
-                "units": "english",
-                "format": "json"
-            }
-            
-            # Construct URL with parameters
-            url_with_params = API_URL + "?" + "&".join([f"{k}={v}" for k, v in params.items()])
-            
-            print("Fetching tide data...")
-            print(f"URL: {url_with_params}")
-            
-            response = self.requests.get(url_with_params)
-            
-            if response.status_code == 200:
-                data = response.json()
-                print("Tide data received successfully")
-                return self.parse_tide_data(data)
-            else:
-                print(f"API request failed with status: {response.status_code}")
-                print(f"Response: {response.text}")
-                return None
-                
-        except Exception as e:
-            print(f"Error fetching tide data: {e}")
-            return None
-    
-    def parse_tide_data(self, data):
-        """Parse tide data and extract hourly predictions"""
-        try:
-            predictions = data.get('predictions', [])
-            if not predictions:
-                print("No tide predictions found in response")
-                return None
-            
-            tide_levels = []
-            for prediction in predictions:
-                # Extract tide level (water height in feet)
-                level = float(prediction.get('v', 0))
-                time_str = prediction.get('t', '')
-                tide_levels.append((time_str, level))
-            
-            print(f"Parsed {len(tide_levels)} tide level readings")
-            return tide_levels
-            
-        except Exception as e:
-            print(f"Error parsing tide data: {e}")
-            return None
-    
-    def normalize_tide_levels(self, tide_levels):
-        """Normalize tide levels to chart height (0-7)"""
-        if not tide_levels:
-            return []
-        
-        # Extract just the numeric values for normalization
-        values = [level for _, level in tide_levels]
-        
-        min_level = min(values)
-        max_level = max(values)
-        level_range = max_level - min_level
-        
-        if level_range == 0:
-            # All levels are the same
-            return [(time_str, 4) for time_str, _ in tide_levels]  # Middle of chart
-        
-        normalized = []
-        for time_str, level in tide_levels:
-            # Normalize to 0-7 range
-            norm_level = int(((level - min_level) / level_range) * 7)
-            # Clamp to valid range
-            norm_level = max(0, min(7, norm_level))
-            normalized.append((time_str, norm_level))
-        
-        return normalized
-    
-    def clear_matrices(self):
-        """Clear all LED matrices"""
-        if self.matrix1:
-            self.matrix1.fill(0)
-        if self.matrix2:
-            self.matrix2.fill(0)
-        if self.matrix3:
-            self.matrix3.fill(0)
+    def clear_matrices(self, show=True):
+        """Clear all LED matrices (show=False only clears the framebuffers)"""
+        for matrix in (self.matrix1, self.matrix2, self.matrix3):
+            if matrix:
+                matrix.fill(0)
+                if show:
+                    matrix.show()
     
-    def display_on_matrices(self, tide_data):
-        """Display tide chart on the LED matrices"""
+    def display_on_matrices(self, tide_data, normalized_data=None):
+        """Display tide chart on the LED matrices (normalized_data is computed if not given)"""
         if not tide_data or not (self.matrix1 and self.matrix2 and self.matrix3):
             print("Cannot display on matrices - data or matrices not available")
             return
             
-        normalized_data = self.normalize_tide_levels(tide_data)
+        if normalized_data is None:
+            normalized_data = self.normalize_tide_levels(tide_data)
         
-        # Clear matrices first
-        self.clear_matrices()
+        # Clear matrices first; each is sent once its bars are drawn
+        self.clear_matrices(show=False)
         
         # Split data into 3 groups of 8 hours each
         matrices = [self.matrix1, self.matrix2, self.matrix3]
+        red, yellow, green = LED_RED, LED_YELLOW, LED_GREEN  # Locals for the loop
         
         for matrix_idx, matrix in enumerate(matrices):
             start_hour = matrix_idx * 8
@@ -189,15 +86,19 @@ class SimpleTideDisplay:
                 # Matrix3: x=0 is 4PM, x=1 is 5PM, etc.
                 matrix_x = hour_offset  # Direct mapping: 0-7 for each matrix
                 
+                # Choose color based on tide level, once for the whole bar
+                if level >= 6:
+                    color = red     # High tide - Red
+                elif level >= 3:
+                    color = yellow  # Medium tide - Yellow
+                else:
+                    color = green   # Low tide - Green
+                
                 # Display vertical bar for this hour up to the tide level
                 for tide_level_y in range(level + 1):  # 0 up to current level
-                    # Choose color based on tide level
-                    if level >= 6:
-                        matrix[matrix_x, tide_level_y] = matrix.LED_RED     # High tide - Red
-                    elif level >= 3:
-                        matrix[matrix_x, tide_level_y] = matrix.LED_YELLOW  # Medium tide - Yellow  
-                    else:
-                        matrix[matrix_x, tide_level_y] = matrix.LED_GREEN   # Low tide - Green
+                    matrix[matrix_x, tide_level_y] = color
+            
+            matrix.show()
         
         print("Tide data displayed on LED matrices")
     
@@ -207,102 +108,29 @@ class SimpleTideDisplay:
             return
             
         # Clear matrices
-        self.clear_matrices()
+        self.clear_matrices(show=False)
         
         # Show red X pattern on middle matrix to indicate error
         matrix = self.matrix2
         for i in range(8):
-            matrix[i, i] = matrix.LED_RED      # Main diagonal
-            matrix[i, 7-i] = matrix.LED_RED    # Counter diagonal
+            matrix[i, i] = LED_RED      # Main diagonal
+            matrix[i, 7-i] = LED_RED    # Counter diagonal
+        
+        for matrix in (self.matrix1, self.matrix2, self.matrix3):
+            matrix.show()
             
         print("Error pattern displayed on LED matrices")
     
-    def run_continuous(self):
-        """Run the tide display continuously (updates every hour)"""
-        print("Starting Tide Clock (Continuous Mode)...")
-        
-        while True:
-            try:
-                tide_data = self.fetch_tide_data()
-                if tide_data:
-                    # Display on both serial console and LED matrices
-                    self.display_ascii_chart(tide_data)
-                    self.display_on_matrices(tide_data)
-                    print("Next update in 1 hour...")
-                else:
-                    print("Failed to get tide data")
-                    self.show_error_on_matrices()
-                    print("Retrying in 10 minutes...")
-                    time.sleep(600)  # Wait 10 minutes before retry
-                    continue
-                
-                # Wait 1 hour before next update
-                time.sleep(UPDATE_INTERVAL)
-                
-            except Exception as e:
-                print(f"Error in main loop: {e}")
-                self.show_error_on_matrices()
-                time.sleep(300)  # Wait 5 minutes before retry
-    
-    def display_ascii_chart(self, tide_data):
-        """Display tide chart as ASCII art in console"""
-        if not tide_data:
-            print("No tide data to display")
-            return
-        
+    def show_tide_data(self, tide_data):
+        """Display on both LED matrices and serial console, normalizing once for both"""
+        # The matrices go first so they don't wait behind the slow serial printout
         normalized_data = self.normalize_tide_levels(tide_data)
-        
-        print("\n" + "="*60)
-        print("24-HOUR TIDE CHART")
-        print("="*60)
-        
-        # Print the chart (8 rows, inverted so high tide is at top)
-        for row in range(7, -1, -1):
-            line = f"{row} |"
-            for time_str, level in normalized_data[:24]:  # Limit to 24 hours
-                if level >= row:
-                    line += "██"  # Unicode block character
-                else:
-                    line += "  "
-            print(line)
-        
-        # Print bottom border
-        print("  +" + "─" * (len(normalized_data[:24]) * 2))
-        
-        # Print hour labels (every 4 hours)
-        hour_line = "   "
-        for i, (time_str, _) in enumerate(normalized_data[:24]):
-            if i % 4 == 0:
-                hour = time_str.split(' ')[1].split(':')[0]  # Extract hour
-                hour_line += f"{hour:>2}" + "  " * 3
-            else:
-                hour_line += "  "
-        print(hour_line)
-        
-        print(f"\nDate: {normalized_data[0][0].split(' ')[0] if normalized_data else 'Unknown'}")
-        print(f"Location: St. Petersburg, FL (Station 8726724)")
-        print(f"Units: Feet above MLLW")
-        print("="*60)
-        
-        # Print raw data for reference
-        print("\nRAW TIDE DATA:")
-        for i, (time_str, level) in enumerate(tide_data[:24]):
-            original_level = [level for _, level in tide_data][i]
-            print(f"{time_str}: {original_level:.2f} ft")
+        self.display_on_matrices(tide_data, normalized_data)
+        self.display_ascii_chart(tide_data, normalized_data)
     
-    def run_once(self):
-        """Run the tide display once (for testing)"""
-        print("Starting Tide Clock (Single Run)...")
-        
-        tide_data = self.fetch_tide_data()
-        if tide_data:
-            # Display on both serial console and LED matrices
-            self.display_ascii_chart(tide_data)
-            self.display_on_matrices(tide_data)
-        else:
-            print("Failed to get tide data")
-            # Show error pattern on matrices
-            self.show_error_on_matrices()
+    def show_error(self):
+        """Show error pattern on matrices"""
+        self.show_error_on_matrices()
 
 def main():
     """Entry point for simple version"""
@@ -312,7 +140,7 @@ def main():
         print("Add your WIFI_SSID and WIFI_PASSWORD to settings.toml")
         return
     
-    tide_display = SimpleTideDisplay()
+    tide_display = BarChartTideDisplay()
     
     # Choose mode: run_once() for testing, run_continuous() for production
     tide_display.run_once()  # Change to run_continuous() for continuous updates
@@ -0,0 +1,415 @@
+# Shared NOAA fetch, parsing and ASCII chart code for the test scripts.
+# serial_tide_display.py uses SimpleTideDisplay as is; the bar chart script subclasses it to add the matrices.
+# Copy this file next to the script on CIRCUITPY (or into /lib). Optionally shrink it with: mpy-cross -O3 tide_core.py
+
+import wifi
+import socketpool
+import ssl
+import adafruit_requests
+import adafruit_connection_manager
+import json
+import time
+import random
+import os
+import storage
+from micropython import const
+
+TIDE_STATION = os.getenv('TIDE_STATION', '8726724')  # Default to St. Petersburg, FL
+UPDATE_INTERVAL = int(os.getenv('UPDATE_INTERVAL', '3600'))  # Default to 1 hour
+# CSV is about half the bytes of NOAA's JSON and parses with a few splits;
+# set TIDE_CSV = "0" to fall back to JSON
+USE_CSV = os.getenv('TIDE_CSV', '1') == '1'
+
+# NOAA API endpoint
+API_URL = "https://api.tidesandcurrents.noaa.gov/api/prod/datagetter"
+
+# Query string is fixed apart from the dates, so build it once at import
+URL_TMPL = (API_URL + "?begin_date=%s&end_date=%s&station=" + TIDE_STATION +
+            "&product=predictions&datum=MLLW&time_zone=lst&interval=h&units=english&format=" +
+            ("csv" if USE_CSV else "json"))
+
+# Chart height bounds for normalize_tide_levels; const() inlines them
+_MAX = const(7)  # Top row
+_MID = const(4)  # Row used when the day's levels are flat
+
+# ASCII chart cells, indexed by a column's bit for the row so every cell
+# reuses one of these two strings (no per-cell slicing or concatenation)
+BLOCK = "██"  # Unicode block character
+SPACES = "  "
+CELLS = (SPACES, BLOCK)
+
+# Predictions for a station and date never change, so each day's response is
+# kept on flash. Needs CIRCUITPY remounted writable in boot.py; otherwise the
+# cache is skipped and every fetch goes to the network.
+CACHE_DIR = "/cache"
+CACHE_MAX_AGE_DAYS = 2
+CACHE_EXT = ".csv" if USE_CSV else ".json"
+
+class SimpleTideDisplay:
+    def __init__(self, ssid, password, use_cache=True):
+        self.ssid = ssid
+        self.password = password
+        self._fail_streak = 0  # Consecutive failed updates, drives the retry backoff
+        self.cache_enabled = False
+        # WiFi and the session come up on the first cache miss (see
+        # fetch_tide_data), so a cached day never pays for the radio or TLS
+        self.pool = None
+        self.requests = None
+        if use_cache:
+            self.setup_cache()
+    
+    def setup_cache(self):
+        """Check the flash cache is writable and evict days older than CACHE_MAX_AGE_DAYS"""
+        try:
+            self.cache_enabled = not storage.getmount("/").readonly
+        except Exception as e:
+            print(f"Cache check failed: {e}")
+            self.cache_enabled = False
+        
+        if not self.cache_enabled:
+            print("Filesystem is read-only, tide cache disabled")
+            return
+        
+        try:
+            os.mkdir(CACHE_DIR)
+        except OSError:
+            pass  # Already exists
+        
+        # File names sort by date, so anything before the cutoff date is stale
+        cutoff = time.localtime(time.time() - CACHE_MAX_AGE_DAYS * 86400)
+        oldest = "%s-%04d%02d%02d%s" % (TIDE_STATION, cutoff.tm_year, cutoff.tm_mon, cutoff.tm_mday, CACHE_EXT)
+        for name in os.listdir(CACHE_DIR):
+            if not name.startswith(TIDE_STATION + "-") or not name.endswith(CACHE_EXT) or name < oldest:
+                try:
+                    os.remove(f"{CACHE_DIR}/{name}")
+                    print(f"Evicted cached tide data: {name}")
+                except OSError as e:
+                    print(f"Failed to evict {name}: {e}")
+    
+    def _cache_path(self, date_str):
+        """Cache file for this station's predictions on the given YYYYMMDD date"""
+        return f"{CACHE_DIR}/{TIDE_STATION}-{date_str}{CACHE_EXT}"
+    
+    def load_cached_data(self, date_str):
+        """Return the cached NOAA response for date_str, or None on a miss"""
+        if not self.cache_enabled:
+            return None
+        try:
+            with open(self._cache_path(date_str), "r") as f:
+                return f.read() if USE_CSV else json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def save_cached_data(self, date_str, data):
+        """Write the NOAA response to the cache via a temp file so a reset can't leave half a file"""
+        if not self.cache_enabled:
+            return
+        path = self._cache_path(date_str)
+        tmp_path = path + ".tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                if USE_CSV:
+                    f.write(data)
+                else:
+                    json.dump(data, f)
+            try:
+                os.remove(path)  # FAT rename won't replace an existing (unreadable) file
+            except OSError:
+                pass
+            os.rename(tmp_path, path)
+        except OSError as e:
+            print(f"Failed to cache tide data: {e}")
+    
+    def setup_network(self):
+        """Initialize WiFi connection and requests session"""
+        try:
+            print("Connecting to WiFi...")
+            wifi.radio.connect(self.ssid, self.password)
+            print(f"Connected to {self.ssid}")
+            
+            # Kept so reset_sockets can close this pool's sockets; the session
+            # (and its SSL context) lives as long as the pool
+            self.pool = socketpool.SocketPool(wifi.radio)
+            self.requests = adafruit_requests.Session(self.pool, ssl.create_default_context())
+        
+        except Exception as e:
+            print(f"Network setup failed: {e}")
+    
+    def fetch_tide_data(self):
+        """Fetch tide data from NOAA API"""
+        parse = self.parse_tide_csv if USE_CSV else self.parse_tide_data
+        try:
+            # Get current date in YYYYMMDD format
+            current_time = time.localtime()
+            date_str = "%04d%02d%02d" % (current_time.tm_year, current_time.tm_mon, current_time.tm_mday)
+            
+            # Same station and date means the same predictions; skip the network.
+            # A hit never needs revalidating (no conditional GET), and
+            # datagetter doesn't send Last-Modified or ETag to validate against.
+            data = self.load_cached_data(date_str)
+            if data is not None:
+                tide_levels = parse(data)
+                if tide_levels:
+                    print("Tide data loaded from cache")
+                    return tide_levels
+                # Truncated or corrupt file: drop it and fetch from the network
+                print("Cached tide data unusable, discarding it")
+                try:
+                    os.remove(self._cache_path(date_str))
+                except OSError as e:
+                    print(f"Failed to remove cached tide data: {e}")
+            
+            if self.requests is None:
+                self.setup_network()
+                if self.requests is None:
+                    return None  # setup_network already printed why
+            
+            # Only the date varies between calls
+            url_with_params = URL_TMPL % (date_str, date_str)
+            
+            print("Fetching tide data...")
+            print(f"URL: {url_with_params}")
+            
+            # Power save makes the radio sleep between beacons, which stalls
+            # the handshake; keep it awake just for this request
+            power_mode = self.disable_power_save()
+            try:
+                response = self.get_keep_alive(url_with_params)
+                
+                try:
+                    if response.status_code == 200:
+                        # json() parses straight off the socket in adafruit_requests;
+                        # a day of CSV is small enough to take in one read
+                        data = response.text if USE_CSV else response.json()
+                        print("Tide data received successfully")
+                        tide_levels = parse(data)
+                        # Only cache a response that actually held predictions
+                        if tide_levels:
+                            self.save_cached_data(date_str, data)
+                        return tide_levels
+                    else:
+                        print(f"API request failed with status: {response.status_code}")
+                        print(f"Response: {response.text}")
+                        return None
+                finally:
+                    # Hand the socket back to the session so the next poll reuses it
+                    response.close()
+            finally:
+                self.restore_power_save(power_mode)
+        
+        except Exception as e:
+            print(f"Error fetching tide data: {e}")
+            return None
+    
+    def disable_power_save(self):
+        """Turn off WiFi power saving and return the previous mode (None if unsupported)"""
+        # power_management needs CircuitPython 9.2 or newer; it is only an
+        # optimization, so any failure leaves the current mode and carries on
+        if not hasattr(wifi.radio, "power_management"):
+            return None
+        try:
+            power_mode = wifi.radio.power_management
+            wifi.radio.power_management = wifi.PowerManagement.NONE
+            return power_mode
+        except Exception as e:
+            print(f"Could not disable WiFi power save: {e}")
+            return None
+    
+    def restore_power_save(self, power_mode):
+        """Put back the WiFi power mode saved by disable_power_save"""
+        if power_mode is not None:
+            try:
+                wifi.radio.power_management = power_mode
+            except Exception as e:
+                print(f"Could not restore WiFi power save: {e}")
+    
+    def reset_sockets(self):
+        """Close every socket held for the pool so the next request connects fresh"""
+        # Sockets live in one ConnectionManager per pool, shared by every
+        # Session on it, so a new Session alone would reuse the same ones
+        try:
+            adafruit_connection_manager.connection_manager_close_all(self.pool)
+        except RuntimeError:
+            pass  # No request has been made on this pool yet
+    
+    def get_keep_alive(self, url, max_tries=3):
+        """GET over a kept-alive connection, closing the pool's sockets after a socket error"""
+        headers = {"Connection": "keep-alive"}
+        for attempt in range(max_tries):
+            try:
+                return self.requests.get(url, headers=headers)
+            except (OSError, adafruit_requests.OutOfRetries, RuntimeError) as e:
+                # adafruit_requests gives up with OutOfRetries (not an OSError)
+                # once its own reconnects fail, and a socket left registered by
+                # a failed request shows up as RuntimeError "already connected"
+                if attempt == max_tries - 1:
+                    raise
+                # The remote may have closed the idle connection between polls
+                print(f"Socket error ({e}), closing sockets and retrying...")
+                self.reset_sockets()
+                time.sleep(0.3)
+    
+    def parse_tide_data(self, data):
+        """Parse tide data and extract hourly predictions"""
+        try:
+            predictions = data.get('predictions', [])
+            if not predictions:
+                print("No tide predictions found in response")
+                return None
+            
+            tide_levels = []
+            for prediction in predictions:
+                # Extract tide level (water height in feet)
+                level = float(prediction.get('v', 0))
+                time_str = prediction.get('t', '')
+                tide_levels.append((time_str, level))
+            
+            print(f"Parsed {len(tide_levels)} tide level readings")
+            return tide_levels
+        
+        except Exception as e:
+            print(f"Error parsing tide data: {e}")
+            return None
+    
+    def parse_tide_csv(self, text):
+        """Parse a NOAA CSV response ("Date Time, Prediction" header) into hourly predictions"""
+        try:
+            tide_levels = []
+            for line in text.splitlines()[1:]:  # Skip the header row
+                if not line:
+                    continue
+                time_str, level = line.rsplit(",", 1)
+                tide_levels.append((time_str, float(level)))
+            
+            if not tide_levels:
+                print("No tide predictions found in response")
+                return None
+            
+            print(f"Parsed {len(tide_levels)} tide level readings")
+            return tide_levels
+        
+        except Exception as e:
+            # NOAA reports errors as plain text in CSV mode
+            print(f"Error parsing tide data: {e}")
+            return None
+    
+    def normalize_tide_levels(self, tide_levels):
+        """Normalize tide levels to chart height (0-7)"""
+        if not tide_levels:
+            return []
+        
+        # Find min and max in one pass, without a separate list of values
+        min_level = max_level = tide_levels[0][1]
+        for _, level in tide_levels:
+            if level < min_level:
+                min_level = level
+            elif level > max_level:
+                max_level = level
+        level_range = max_level - min_level
+        
+        if level_range == 0:
+            # All levels are the same
+            return [(time_str, _MID) for time_str, _ in tide_levels]  # Middle of chart
+        
+        # Normalize to 0-7 range; (level - min) / range is already within
+        # [0, 1], so no clamp is needed
+        return [(time_str, int(((level - min_level) / level_range) * _MAX))
+                for time_str, level in tide_levels]
+    
+    def show_tide_data(self, tide_data):
+        """Show freshly fetched tide data (console only; subclasses add displays)"""
+        self.display_ascii_chart(tide_data)
+    
+    def show_error(self):
+        """Indicate a failed update (nothing to do without a display)"""
+        pass
+    
+    def run_continuous(self):
+        """Run the tide display continuously (updates every hour)"""
+        print("Starting Tide Clock (Continuous Mode)...")
+        
+        while True:
+            try:
+                tide_data = self.fetch_tide_data()
+                if tide_data:
+                    self.show_tide_data(tide_data)
+                    self._fail_streak = 0
+                    print("Next update in 1 hour...")
+                else:
+                    print("Failed to get tide data")
+                    self.show_error()
+                    self.sleep_backoff()
+                    continue
+                
+                # Wait 1 hour before next update
+                time.sleep(UPDATE_INTERVAL)
+            
+            except Exception as e:
+                print(f"Error in main loop: {e}")
+                self.show_error()
+                self.sleep_backoff()
+    
+    def sleep_backoff(self):
+        """Wait before retrying: exponential backoff from 30s, capped at an hour"""
+        # Jitter keeps devices that failed together from retrying together
+        delay = min(3600, 30 * (2 ** self._fail_streak)) + random.randint(0, 30)
+        # The cap is reached at 7, so stop counting there
+        self._fail_streak = min(self._fail_streak + 1, 7)
+        print(f"Retrying in {delay} seconds...")
+        time.sleep(delay)
+    
+    def display_ascii_chart(self, tide_data, normalized_data=None):
+        """Display tide chart as ASCII art in console (normalized_data is computed if not given)"""
+        if not tide_data:
+            print("No tide data to display")
+            return
+        
+        if normalized_data is None:
+            normalized_data = self.normalize_tide_levels(tide_data)
+        
+        print("\n" + "="*60)
+        print("24-HOUR TIDE CHART")
+        print("="*60)
+        
+        # One bitmask per hour (limited to 24) with bits 0..level set, so each
+        # row is a bit lookup per cell and a single join
+        cols = [(1 << (level + 1)) - 1 for _, level in normalized_data[:24]]
+        
+        # Print the chart (8 rows, inverted so high tide is at top)
+        for row in range(7, -1, -1):
+            print(f"{row} |" + "".join([CELLS[c >> row & 1] for c in cols]))
+        
+        # Print bottom border
+        print("  +" + "─" * (len(normalized_data[:24]) * 2))
+        
+        # Print hour labels (every 4 hours)
+        hour_line = "   "
+        for i, (time_str, _) in enumerate(normalized_data[:24]):
+            if i % 4 == 0:
+                # "YYYY-MM-DD HH:MM" - slice the hour, no split; the label takes
+                # its own 2-char column like every other hour
+                hour_line += f"{time_str[11:13]:>2}"
+            else:
+                hour_line += "  "
+        print(hour_line)
+        
+        print(f"\nDate: {normalized_data[0][0].split(' ')[0] if normalized_data else 'Unknown'}")
+        print(f"Station: {TIDE_STATION}")
+        print(f"Units: Feet above MLLW")
+        print("="*60)
+        
+        # Print raw data for reference
+        print("\nRAW TIDE DATA:")
+        for time_str, level in tide_data[:24]:
+            print(f"{time_str}: {level:.2f} ft")
+    
+    def run_once(self):
+        """Run the tide display once (for testing)"""
+        print("Starting Tide Clock (Single Run)...")
+        
+        tide_data = self.fetch_tide_data()
+        if tide_data:
+            self.show_tide_data(tide_data)
+        else:
+            print("Failed to get tide data")
+            self.show_error()